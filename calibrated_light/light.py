@@ -71,18 +71,17 @@ async def async_setup_platform(
 
 def clamp_rgb(value):
     """Clamp a given value between 0 and 255."""
-    return min(max(value, 0), 255)
+    return 0 if value < 0 else (255 if value > 255 else value)
 
 
 def apply_calibration(
-    calibration: Tuple[int, int, int], color_rgb: Tuple[int, int, int], invert=False
+    calibration: Tuple[int, int, int], color_rgb: Tuple[int, int, int]
 ) -> Tuple[int, int, int]:
     """Apply an RGB color calibration."""
-    modifier = -1 if invert else 1
     return (
-        clamp_rgb(color_rgb[0] + (calibration[0] * modifier)),
-        clamp_rgb(color_rgb[1] + (calibration[1] * modifier)),
-        clamp_rgb(color_rgb[2] + (calibration[2] * modifier)),
+        clamp_rgb(color_rgb[0] + calibration[0]),
+        clamp_rgb(color_rgb[1] + calibration[1]),
+        clamp_rgb(color_rgb[2] + calibration[2]),
     )
 
 
@@ -102,8 +101,10 @@ class CalibratedLight(LightEntity):
         """Initialize the calibrated light entity."""
         self._light_entity_id = light_entity_id
         self._light_state: State | None = None
+        self._rgb_color: tuple[int, int, int] | None = None
         self._name = name
-        self._calibration_rgb = calibration_rgb
+        self._calibration_rgb = tuple(calibration_rgb)
+        self._inverse_calibration_rgb = tuple(-offset for offset in calibration_rgb)
         self._unique_id = unique_id
 
     @property
@@ -122,11 +123,7 @@ class CalibratedLight(LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the rgb color value [int, int, int]."""
-        return apply_calibration(
-            self._calibration_rgb,
-            self._light_state.attributes.get(ATTR_RGB_COLOR),
-            invert=True,
-        )
+        return self._rgb_color
 
     @property
     def name(self) -> str:
@@ -200,12 +197,12 @@ class CalibratedLight(LightEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
-        self._light_state = self.hass.states.get(self._light_entity_id)
+        self._update_light_state()
 
         @callback
         def async_state_changed_listener(*_: Any) -> None:
             """Handle child updates."""
-            self._light_state = self.hass.states.get(self._light_entity_id)
+            self._update_light_state()
             self.async_write_ha_state()
 
         self.async_on_remove(
@@ -213,3 +210,18 @@ class CalibratedLight(LightEntity):
                 self.hass, [self._light_entity_id], async_state_changed_listener
             )
         )
+
+    @callback
+    def _update_light_state(self) -> None:
+        """Refresh the wrapped light state and its calibrated color."""
+        self._light_state = self.hass.states.get(self._light_entity_id)
+        color_rgb = (
+            self._light_state.attributes.get(ATTR_RGB_COLOR)
+            if self._light_state is not None
+            else None
+        )
+        self._rgb_color = (
+            apply_calibration(self._inverse_calibration_rgb, color_rgb)
+            if color_rgb is not None
+            else None
+        )
@@ -1,16 +1,18 @@
 """The transportnsw component."""
+from __future__ import annotations
+
+import asyncio
 import datetime
 import logging
-import threading
 import time
-from functools import lru_cache
-from typing import Any, Tuple, List
+from typing import Any, Awaitable, Callable, Dict, Tuple, List
 
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import CONF_API_KEY, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.discovery import async_load_platform
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -22,12 +24,14 @@ from .sensor import (
     CONF_DESTINATION_STOP_ID,
     CONF_NUM_JOURNEYS,
     CONF_MODES_OF_TRANSPORT,
+    JourneyData,
 )
-from .transportnsw_client import TransportNSWClient, Journey
+from .transportnsw_client import TransportNSWClient
 from .transportnsw_client.utils import (
+    build_realtime_index,
     get_gtfs_mode,
-    get_first_nonwalking_leg,
-    find_realtime_info,
+    get_last_nonwalking_leg,
+    summarize_legs,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,55 +57,31 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config[DOMAIN]
-    client = TransportNSWClient(conf[CONF_API_KEY])
-    gtfs_cache = GTFSCache(client)
+    client = TransportNSWClient(async_get_clientsession(hass), conf[CONF_API_KEY])
+    gtfs_cache = GTFSCache(hass, client)
 
-    for trip in conf[CONF_TRIPS]:
+    # Trips with identical request parameters share a single coordinator so the API
+    # is only queried once per refresh.
+    coordinators: Dict[Tuple, DataUpdateCoordinator] = {}
 
-        async def async_update_data() -> List[Tuple[Journey, Any]]:
-            resp = await hass.async_add_executor_job(
-                client.get_trip,
-                trip[CONF_STOP_ID],
-                trip[CONF_DESTINATION_STOP_ID],
-                trip[CONF_NUM_JOURNEYS],
-                None,
-                None,
-                trip.get(CONF_MODES_OF_TRANSPORT),
-            )
-            res = []
-
-            # Hydrate journey information with realtime information if it is available. This
-            # utilises an LRU cache with TTL to avoid hammering the GTFS endpoint for every
-            # defined trip.
-            for journey in resp.journeys:
-                realtime = None
-
-                origin_leg = get_first_nonwalking_leg(journey.legs)
-                if origin_leg is not None:
-                    realtime_trip_id = (
-                        origin_leg.transportation.properties.realtime_trip_id
-                    )
-                    mode = get_gtfs_mode(origin_leg.transportation.product.klass)
-
-                    if realtime_trip_id is not None and mode is not None:
-                        feed = await hass.async_add_executor_job(
-                            gtfs_cache.get_gtfs_feed,
-                            mode,
-                        )
-                        realtime = find_realtime_info(feed, realtime_trip_id)
-
-                res.append((journey, realtime))
-
-            return res
-
-        coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name="sensor",
-            update_interval=SCAN_INTERVAL,
-            update_method=async_update_data,
+    for trip in conf[CONF_TRIPS]:
+        key = (
+            trip[CONF_STOP_ID],
+            trip[CONF_DESTINATION_STOP_ID],
+            trip[CONF_NUM_JOURNEYS],
+            tuple(sorted(trip.get(CONF_MODES_OF_TRANSPORT) or ())),
         )
-        await coordinator.async_refresh()
+        coordinator = coordinators.get(key)
+        if coordinator is None:
+            coordinator = DataUpdateCoordinator(
+                hass,
+                _LOGGER,
+                name="sensor",
+                update_interval=SCAN_INTERVAL,
+                update_method=make_updater(client, gtfs_cache, trip),
+            )
+            await coordinator.async_refresh()
+            coordinators[key] = coordinator
 
         hass.async_create_task(
             async_load_platform(
@@ -116,15 +96,115 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-class GTFSCache:
-    def __init__(self, client: TransportNSWClient):
-        self._client = client
-        self._lock = threading.Lock()
+def make_updater(
+    client: TransportNSWClient, gtfs_cache: GTFSCache, trip: ConfigType
+) -> Callable[[], Awaitable[List[JourneyData]]]:
+    """Create the coordinator update method for a single configured trip."""
 
-    def get_gtfs_feed(self, mode):
-        with self._lock:
-            return self._get_gtfs_feed(mode=mode, ttl_hash=round(time.time() / 60))
+    async def async_update_data() -> List[JourneyData]:
+        resp = await client.get_trip(
+            trip[CONF_STOP_ID],
+            trip[CONF_DESTINATION_STOP_ID],
+            trip[CONF_NUM_JOURNEYS],
+            None,
+            None,
+            trip.get(CONF_MODES_OF_TRANSPORT),
+        )
+        now = datetime.datetime.now(datetime.timezone.utc)
+        summaries = [summarize_legs(journey.legs) for journey in resp.journeys]
+        realtime_keys = [
+            (
+                get_gtfs_mode(origin_leg.transportation.product.klass),
+                origin_leg.transportation.properties.realtime_trip_id,
+            )
+            if origin_leg is not None
+            else (None, None)
+            for origin_leg, _ in summaries
+        ]
+
+        # Hydrate journey information with realtime information if it is available. This
+        # utilises a cache with TTL to avoid hammering the GTFS endpoint for every
+        # defined trip. Feeds for all required modes are fetched concurrently.
+        modes = {
+            mode
+            for mode, realtime_trip_id in realtime_keys
+            if mode is not None and realtime_trip_id is not None
+        }
+        indexes = dict(
+            zip(
+                modes,
+                await asyncio.gather(
+                    *(gtfs_cache.get_gtfs_index(mode) for mode in modes)
+                ),
+            )
+        )
+
+        res = []
+        for journey, (origin_leg, trip_changes), (mode, realtime_trip_id) in zip(
+            resp.journeys, summaries, realtime_keys
+        ):
+            realtime = None
+            if mode in indexes and realtime_trip_id is not None:
+                realtime = indexes[mode].get(realtime_trip_id)
+
+            res.append(
+                JourneyData(
+                    journey=journey,
+                    realtime=realtime,
+                    origin_leg=origin_leg,
+                    dest_leg=get_last_nonwalking_leg(journey.legs),
+                    trip_changes=trip_changes,
+                    tickets=journey.fare.tickets_by_person,
+                    now=now,
+                )
+            )
+
+        return res
 
-    @lru_cache()
-    def _get_gtfs_feed(self, mode, ttl_hash=None):
-        return self._client.get_realtime_feed(mode)
+    return async_update_data
+
+
+class GTFSCache:
+    def __init__(self, hass: HomeAssistant, client: TransportNSWClient):
+        self._hass = hass
+        self._client = client
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    async def get_gtfs_index(self, mode) -> Dict[str, Any]:
+        """Return the feed's vehicle entities keyed by realtime trip id."""
+        key = (mode, int(time.time() // 60))
+        if key in self._cache:
+            return self._cache[key]
+
+        # Coalesce concurrent requests for the same feed onto a single fetch. The fetch
+        # is shielded so cancelling one caller does not cancel it for the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._hass.async_create_task(self._fetch_gtfs_index(key))
+            task.add_done_callback(_consume_gtfs_fetch_error)
+            # An eagerly started task may already be done (and have cleaned up).
+            if not task.done():
+                self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_gtfs_index(self, key: Tuple[str, int]) -> Dict[str, Any]:
+        mode, minute = key
+        try:
+            feed = await self._client.get_realtime_feed(mode)
+        finally:
+            self._inflight.pop(key, None)
+
+        index = build_realtime_index(feed)
+
+        self._cache[key] = index
+        for stale_key in [k for k in self._cache if k[1] < minute - 1]:
+            del self._cache[stale_key]
+        return index
+
+
+def _consume_gtfs_fetch_error(task: asyncio.Task) -> None:
+    # Failures are reported by the coordinators awaiting the fetch; retrieve the
+    # exception so an unawaited task does not log "exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
@@ -3,15 +3,14 @@ from __future__ import annotations
 
 import datetime
 import logging
-import math
-from typing import List, Tuple, Any, get_args
+from typing import Dict, List, NamedTuple, Tuple, Any, get_args
 
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import CONF_NAME, UnitOfTime, CURRENCY_DOLLAR
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import (
@@ -19,12 +18,14 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 from .transportnsw_client import ModeOfTransport
-from .transportnsw_client.model import Journey, RouteProductClass, TripRequestResponse
-from .transportnsw_client.utils import (
-    get_ticket,
-    get_first_nonwalking_leg,
-    count_trip_changes,
+from .transportnsw_client.model import (
+    Journey,
+    JourneyFareTicket,
+    JourneyLeg,
+    RouteProductClass,
+    TripRequestResponse,
 )
+from .transportnsw_client.utils import get_product_class_name
 import homeassistant.util.dt as dt_util
 
 
@@ -69,6 +70,21 @@ ICONS = {
     None: "mdi:clock",
 }
 
+
+class JourneyData(NamedTuple):
+    """Coordinator data for a single journey."""
+
+    journey: Journey
+    # Realtime vehicle information, if available.
+    realtime: Any
+    origin_leg: JourneyLeg | None
+    dest_leg: JourneyLeg | None
+    trip_changes: int
+    tickets: Dict[str, JourneyFareTicket]
+    # Time at which the journey was fetched.
+    now: datetime.datetime
+
+
 CONF_COORDINATOR = "coordinator"
 CONF_STOP_ID = "stop_id"
 CONF_DESTINATION_STOP_ID = "destination_stop_id"
@@ -77,6 +93,8 @@ CONF_FARE_TYPE = "fare_type"
 CONF_MODES_OF_TRANSPORT = "modes_of_transport"
 CONF_ALLOWED_MOT = []
 
+_MOT_SET = frozenset(get_args(ModeOfTransport))
+
 CONF_TRIP = "trip"
 CONF_TRIP_SCHEMA = vol.Schema(
     {
@@ -86,7 +104,7 @@ CONF_TRIP_SCHEMA = vol.Schema(
         vol.Optional(CONF_NUM_JOURNEYS, default=1): cv.positive_int,
         vol.Optional(CONF_FARE_TYPE, default="ADULT"): cv.string,
         vol.Optional(CONF_MODES_OF_TRANSPORT): vol.All(
-            cv.ensure_list, [vol.In(get_args(ModeOfTransport))]
+            cv.ensure_list, [vol.In(_MOT_SET)]
         ),
     }
 )
@@ -137,7 +155,7 @@ def setup_platform(
 
 
 class TransportNSWJourneyFareSensor(
-    CoordinatorEntity[DataUpdateCoordinator[List[Tuple[Journey, Any]]]], SensorEntity
+    CoordinatorEntity[DataUpdateCoordinator[List[JourneyData]]], SensorEntity
 ):
     _attr_attribution = "Data provided by Transport NSW"
     _attr_native_unit_of_measurement = CURRENCY_DOLLAR
@@ -145,7 +163,7 @@ class TransportNSWJourneyFareSensor(
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[List[Tuple[Journey, Any]]],
+        coordinator: DataUpdateCoordinator[List[JourneyData]],
         name: str,
         stop_id: str,
         destination_stop_id: str,
@@ -155,16 +173,15 @@ class TransportNSWJourneyFareSensor(
         """Initialize the sensor."""
         super().__init__(coordinator)
 
-        self._name = name
-        self._stop_id = stop_id
-        self._destination_stop_id = destination_stop_id
         self._trip_index = trip_index
         self._fare_type = fare_type
 
-        self._attr_name = f"{name} {trip_index + 1} {self._fare_type.capitalize()} Fare"
-        self._attr_unique_id = f"tnsw-{self._stop_id}-{self._destination_stop_id}-{self._trip_index}-fare-{self._fare_type}"
+        self._attr_name = f"{name} {trip_index + 1} {fare_type.capitalize()} Fare"
+        self._attr_unique_id = (
+            f"tnsw-{stop_id}-{destination_stop_id}-{trip_index}-fare-{fare_type}"
+        )
 
-    def _get_journey(self) -> Tuple[Journey, Any] | None:
+    def _get_journey(self) -> JourneyData | None:
         if (
             self.coordinator.data is None
             or len(self.coordinator.data) <= self._trip_index
@@ -176,11 +193,14 @@ class TransportNSWJourneyFareSensor(
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        journey, _ = self._get_journey()
-        if journey is None:
+        journey_info = self._get_journey()
+        if journey_info is None:
+            return None
+
+        ticket = journey_info.tickets.get(self._fare_type)
+        if ticket is None:
             return None
 
-        ticket = get_ticket(journey.fare.tickets, self._fare_type)
         return str(ticket.priceBrutto)
 
     @property
@@ -190,14 +210,14 @@ class TransportNSWJourneyFareSensor(
 
 
 class TransportNSWJourneySensor(
-    CoordinatorEntity[DataUpdateCoordinator[List[Tuple[Journey, Any]]]], SensorEntity
+    CoordinatorEntity[DataUpdateCoordinator[List[JourneyData]]], SensorEntity
 ):
     _attr_attribution = "Data provided by Transport NSW"
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[List[Tuple[Journey, Any]]],
+        coordinator: DataUpdateCoordinator[List[JourneyData]],
         name: str,
         stop_id: str,
         destination_stop_id: str,
@@ -207,18 +227,16 @@ class TransportNSWJourneySensor(
         """Initialize the sensor."""
         super().__init__(coordinator)
 
-        self._name = name
-        self._stop_id = stop_id
-        self._destination_stop_id = destination_stop_id
         self._trip_index = trip_index
         self._fare_type = fare_type
 
+        self._cached_journey: Journey | None = None
+        self._cached_derived: Tuple[int, Dict[str, Any]] | None = None
+
         self._attr_name = f"{name} {trip_index + 1}"
-        self._attr_unique_id = (
-            f"tnsw-{self._stop_id}-{self._destination_stop_id}-{self._trip_index}"
-        )
+        self._attr_unique_id = f"tnsw-{stop_id}-{destination_stop_id}-{trip_index}"
 
-    def _get_journey(self) -> Tuple[Journey, Any] | None:
+    def _get_journey(self) -> JourneyData | None:
         if (
             self.coordinator.data is None
             or len(self.coordinator.data) <= self._trip_index
@@ -227,45 +245,75 @@ class TransportNSWJourneySensor(
 
         return self.coordinator.data[self._trip_index]
 
-    @property
-    def should_poll(self) -> bool:
-        """Return True if entity has to be polled for state."""
-        return True
-
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        journey, _ = self._get_journey()
-        if journey is None:
+        derived = self._get_derived()
+        if derived is None:
             return None
 
-        origin_leg = get_first_nonwalking_leg(journey.legs)
-        origin = origin_leg.origin
-        due = origin.departureTimeEstimated - datetime.datetime.now(
-            datetime.timezone.utc
-        )
-
-        return math.floor(max(due.total_seconds() / 60, 0))
+        due, _ = derived
+        return due
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        journey, realtime = self._get_journey()
-        if journey is None:
+        derived = self._get_derived()
+        if derived is None:
             return None
 
-        origin_leg = get_first_nonwalking_leg(journey.legs)
-        dest_leg = get_first_nonwalking_leg(reversed(journey.legs))
+        _, attrs = derived
+        return attrs
+
+    @property
+    def icon(self):
+        """Icon to use in the frontend, if any."""
+        journey_info = self._get_journey()
+        if journey_info is None:
+            return "mdi:clock"
+
+        origin_leg = journey_info.origin_leg
+        return ICONS.get(origin_leg.transportation.product.klass, "mdi:clock")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate derived journey fields before writing the new state."""
+        self._cached_journey = None
+        super()._handle_coordinator_update()
+
+    def _get_derived(self) -> Tuple[int, Dict[str, Any]] | None:
+        """Return the minutes until departure and state attributes.
+
+        These are computed once per coordinator update rather than on every
+        property read.
+        """
+        journey_info = self._get_journey()
+        if journey_info is None:
+            return None
+
+        if journey_info.journey is not self._cached_journey:
+            self._cached_derived = self._compute_derived(journey_info)
+            self._cached_journey = journey_info.journey
+
+        return self._cached_derived
+
+    def _compute_derived(self, journey_info: JourneyData) -> Tuple[int, Dict[str, Any]]:
+        realtime = journey_info.realtime
+        origin_leg = journey_info.origin_leg
+        trip_changes = journey_info.trip_changes
 
         origin = origin_leg.origin
-        destination = dest_leg.destination
-        trip_changes = count_trip_changes(journey.legs)
+        destination = journey_info.dest_leg.destination
 
-        ticket = get_ticket(journey.fare.tickets, self._fare_type)
+        delta = origin.departureTimeEstimated - journey_info.now
+        due_seconds = delta.days * 86400 + delta.seconds
+        due = due_seconds // 60 if due_seconds > 0 else 0
+
+        ticket = journey_info.tickets.get(self._fare_type)
 
         tz = dt_util.get_time_zone(self.hass.config.time_zone)
 
-        return {
+        attrs = {
             ATTR_ORIGIN_STOP_ID: origin.id,
             ATTR_ORIGIN_NAME: origin.name,
             ATTR_DESTINATION_STOP_ID: destination.id,
@@ -299,14 +347,16 @@ class TransportNSWJourneySensor(
                 / 60
             ),
             ATTR_ORIGIN_TRANSPORT_TYPE: origin_leg.transportation.product.klass,
-            ATTR_ORIGIN_TRANSPORT_NAME: origin_leg.transportation.product.klass.name,
+            ATTR_ORIGIN_TRANSPORT_NAME: get_product_class_name(
+                origin_leg.transportation.product.klass
+            ),
             ATTR_ORIGIN_LINE_NAME: origin_leg.transportation.number,
             ATTR_ORIGIN_LINE_NAME_SHORT: origin_leg.transportation.disassembledName,
             ATTR_CHANGES: trip_changes,
             ATTR_OCCUPANCY: origin_leg.destination.properties.occupancy,
             ATTR_REAL_TIME_TRIP_ID: origin_leg.transportation.properties.realtime_trip_id,
-            ATTR_FARE_TYPE: ticket.person,
-            ATTR_FARE_PRICE: str(ticket.priceBrutto),
+            ATTR_FARE_TYPE: ticket.person if ticket is not None else None,
+            ATTR_FARE_PRICE: str(ticket.priceBrutto) if ticket is not None else None,
             ATTR_LATITUDE: realtime.vehicle.position.latitude
             if realtime is not None
             else None,
@@ -315,25 +365,9 @@ class TransportNSWJourneySensor(
             else None,
         }
 
-    @property
-    def icon(self):
-        """Icon to use in the frontend, if any."""
-        journey, _ = self._get_journey()
-        if journey is None:
-            return "mdi:clock"
-
-        origin_leg = get_first_nonwalking_leg(journey.legs)
-        return ICONS.get(origin_leg.transportation.product.klass, "mdi:clock")
+        return due, attrs
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.data is not None
-
-
-def get_due(estimated):
-    """Min until departure"""
-    due = 0
-    if estimated > datetime.datetime.utcnow():
-        due = round((estimated - datetime.datetime.utcnow()).seconds / 60)
-    return due
@@ -1,7 +1,8 @@
 import datetime
-from typing import Literal, List
+from functools import lru_cache
+from typing import FrozenSet, Literal, List, Tuple
 
-import requests
+import aiohttp
 from google.transit import gtfs_realtime_pb2
 
 from .model import TripRequestResponse, RouteProductClass, Journey, JourneyLeg
@@ -10,10 +11,11 @@ ModeOfTransport = Literal["train", "light_rail", "bus", "coach", "ferry", "schoo
 
 
 class TransportNSWClient:
-    def __init__(self, api_key: str):
-        self._api_key = api_key
+    def __init__(self, session: aiohttp.ClientSession, api_key: str):
+        self._session = session
+        self._headers = {"Authorization": f"apikey {api_key}"}
 
-    def get_trip(
+    async def get_trip(
         self,
         origin: str,
         destination: str,
@@ -48,24 +50,24 @@ class TransportNSWClient:
             "TfNSWTR": "true",
             **exclude_mot_params,
         }
-        resp = requests.get(
+        async with self._session.get(
             "https://api.transport.nsw.gov.au/v1/tp/trip",
             params=params,
-            headers={"Authorization": f"apikey {self._api_key}"},
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        return TripRequestResponse(**data)
+            headers=self._headers,
+        ) as resp:
+            resp.raise_for_status()
+            return TripRequestResponse.model_validate_json(await resp.read())
 
-    def get_realtime_feed(self, mode: str):
-        resp = requests.get(
+    async def get_realtime_feed(self, mode: str):
+        async with self._session.get(
             f"https://api.transport.nsw.gov.au/v1/gtfs/vehiclepos/{mode}",
-            headers={"Authorization": f"apikey {self._api_key}"},
-        )
-        resp.raise_for_status()
+            headers=self._headers,
+        ) as resp:
+            resp.raise_for_status()
+            content = await resp.read()
 
         feed = gtfs_realtime_pb2.FeedMessage()
-        feed.ParseFromString(resp.content)
+        feed.ParseFromString(content)
         return feed
 
 
@@ -82,16 +84,29 @@ excl_mot_map = {
 def get_exclude_mot_params(
     include_mot: List[ModeOfTransport] | None, exclude_mot: List[ModeOfTransport] | None
 ):
-    params = {}
+    return dict(
+        _get_exclude_mot_params(
+            frozenset(include_mot) if include_mot is not None else None,
+            frozenset(exclude_mot) if exclude_mot is not None else None,
+        )
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_exclude_mot_params(
+    include_mot: FrozenSet[ModeOfTransport] | None,
+    exclude_mot: FrozenSet[ModeOfTransport] | None,
+) -> Tuple[Tuple[str, str], ...]:
+    params = []
 
     if include_mot:
-        exclude = set(excl_mot_map.keys()) - set(include_mot)
-        params["excludedMeans"] = "checkbox"
-        for entry in exclude:
-            params[excl_mot_map[entry]] = "1"
+        exclude = set(excl_mot_map.keys()) - include_mot
+        params.append(("excludedMeans", "checkbox"))
+        for entry in sorted(exclude):
+            params.append((excl_mot_map[entry], "1"))
     elif exclude_mot is not None:
-        params["excludedMeans"] = "checkbox"
-        for mot in exclude_mot:
-            params[excl_mot_map[mot]] = "1"
+        params.append(("excludedMeans", "checkbox"))
+        for mot in sorted(exclude_mot):
+            params.append((excl_mot_map[mot], "1"))
 
-    return params
+    return tuple(params)
@@ -1,28 +1,34 @@
+import asyncio
 import datetime
 import sys
 
+import aiohttp
+
 from .utils import (
-    count_trip_changes,
-    get_first_nonwalking_leg,
+    get_last_nonwalking_leg,
     get_gtfs_mode,
     find_realtime_info,
+    summarize_legs,
 )
 from . import TransportNSWClient
 
 
-def main():
-    client = TransportNSWClient(sys.argv[1])
-    resp = client.get_trip(
+async def main():
+    async with aiohttp.ClientSession() as session:
+        await print_trip(TransportNSWClient(session, sys.argv[1]))
+
+
+async def print_trip(client: TransportNSWClient):
+    resp = await client.get_trip(
         origin="222310", destination="200060", num_journeys=1, include_mot=["bus"]
     )
 
     for journey in resp.journeys:
-        origin_leg = get_first_nonwalking_leg(journey.legs)
-        dest_leg = get_first_nonwalking_leg(reversed(journey.legs))
+        origin_leg, trip_changes = summarize_legs(journey.legs)
+        dest_leg = get_last_nonwalking_leg(journey.legs)
 
         origin = origin_leg.origin
         destination = dest_leg.destination
-        trip_changes = count_trip_changes(journey.legs)
 
         print("Origin", origin.id, origin.name, origin.disassembledName)
         print(
@@ -58,10 +64,10 @@ def main():
         realtime_trip_id = origin_leg.transportation.properties.realtime_trip_id
         mode = get_gtfs_mode(origin_leg.transportation.product.klass)
         if mode is not None and realtime_trip_id is not None:
-            feed = client.get_realtime_feed(mode)
+            feed = await client.get_realtime_feed(mode)
             realtime = find_realtime_info(feed, realtime_trip_id)
             print(realtime.vehicle.position)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,65 +1,91 @@
 import datetime
-import decimal
-from enum import Enum
-from typing import List, Literal
+from enum import IntEnum, StrEnum
+from functools import cached_property
+from typing import Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class JourneyFareZone(BaseModel):
-    pass
+class _FastModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
 
 
-class JourneyFareTicket(BaseModel):
+class Person(StrEnum):
+    ADULT = "ADULT"
+    CHILD = "CHILD"
+    SCHOLAR = "SCHOLAR"
+    SENIOR = "SENIOR"
+
+
+class Priority(StrEnum):
+    VERY_LOW = "veryLow"
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+    VERY_HIGH = "veryHigh"
+
+
+class JourneyFareTicket(_FastModel):
     id: str
     name: str
     comment: str
-    person: Literal["ADULT", "CHILD", "SCHOLAR", "SENIOR"]
-    priceLevel: str | None
-    priceBrutto: decimal.Decimal
+    person: Person
+    priceLevel: str | None = None
+    priceBrutto: float
 
 
-class Fare(BaseModel):
+class Fare(_FastModel):
     tickets: List[JourneyFareTicket]
-    zones: List[JourneyFareZone] | None = Field(default=None)
+    zones: List[dict] | None = None
+
+    @cached_property
+    def tickets_by_person(self) -> Dict[Person, JourneyFareTicket]:
+        return {ticket.person: ticket for ticket in self.tickets}
 
 
-class AdditionalInfoResponseTimestamps(BaseModel):
+class AdditionalInfoResponseTimestamps(_FastModel):
     creation: datetime.datetime
     lastModification: datetime.datetime
     # availability:
     # validity
 
 
-class JourneyLegStopInfo(BaseModel):
-    timestamps: AdditionalInfoResponseTimestamps | None = Field(default=None)
-    priority: Literal["veryLow", "low", "normal", "high", "veryHigh"]
+class JourneyLegStopInfo(_FastModel):
+    # Sub-models which are rarely read are kept raw and validated on first access.
+    timestamps_raw: dict | None = Field(alias="timestamps", default=None)
+    priority: Priority
     id: str
     version: int
-    urlText: str | None
-    url: str | None
-    content: str | None
-    subtitle: str | None
+    urlText: str | None = None
+    url: str | None = None
+    content: str | None = None
+    subtitle: str | None = None
 
+    @cached_property
+    def timestamps(self) -> AdditionalInfoResponseTimestamps | None:
+        if self.timestamps_raw is None:
+            return None
+        return AdditionalInfoResponseTimestamps.model_validate(self.timestamps_raw)
 
-class JourneyLegStop(BaseModel):
-    class JourneyLegStopProperties(BaseModel):
-        occupancy: str = Field(default=None)
+
+class JourneyLegStop(_FastModel):
+    class JourneyLegStopProperties(_FastModel):
+        occupancy: str | None = None
 
     id: str
     name: str
-    disassembledName: str | None
+    disassembledName: str | None = None
     type: str
     # coord
     # parent
-    departureTimeEstimated: datetime.datetime | None = Field(default=None)
-    departureTimePlanned: datetime.datetime | None = Field(default=None)
-    arrivalTimeEstimated: datetime.datetime | None = Field(default=None)
-    arrivalTimePlanned: datetime.datetime | None = Field(default=None)
+    departureTimeEstimated: datetime.datetime | None = None
+    departureTimePlanned: datetime.datetime | None = None
+    arrivalTimeEstimated: datetime.datetime | None = None
+    arrivalTimePlanned: datetime.datetime | None = None
     properties: JourneyLegStopProperties
 
 
-class RouteProductClass(Enum):
+class RouteProductClass(IntEnum):
     TRAIN = 1
     LIGHT_RAIL = 4
     BUS = 5
@@ -76,7 +102,11 @@ class RouteProductClass(Enum):
     CAR = 106
 
 
-class RouteProduct(BaseModel):
+# Both 99 and 100 indicate walking.
+WALKING_KLASSES = frozenset((99, 100))
+
+
+class RouteProduct(_FastModel):
     name: str
     # 1: Train
     # 4: Light Rail
@@ -92,18 +122,19 @@ class RouteProduct(BaseModel):
     # 104: Park & Ride
     # 105: Taxi
     # 106: Car
-    klass: RouteProductClass = Field(alias="class")
+    # Kept as a raw int (see RouteProductClass) so unknown product classes still parse.
+    klass: int = Field(alias="class")
     iconId: int
 
 
-class TripTransportation(BaseModel):
-    class TripTransportationProperties(BaseModel):
+class TripTransportation(_FastModel):
+    class TripTransportationProperties(_FastModel):
         realtime_trip_id: str | None = Field(alias="RealtimeTripId", default=None)
 
-    id: str | None
-    name: str | None
-    disassembledName: str | None
-    number: str | None
+    id: str | None = None
+    name: str | None = None
+    disassembledName: str | None = None
+    number: str | None = None
     # 1: Sydney Trains (product class 1)
     # 2: Intercity Trains (product class 1)
     # 3: Regional Trains (product class 1)
@@ -126,36 +157,40 @@ class TripTransportation(BaseModel):
     # 12: Private Ferries (product class 9)
     # 18: Temporary Ferries (product class 9)
     # 8: School Buses (product class 11)
-    iconId: int | None
-    description: str | None
+    iconId: int | None = None
+    description: str | None = None
     product: RouteProduct
     # operator
     # destination
     properties: TripTransportationProperties
 
 
-class JourneyLeg(BaseModel):
+class JourneyLeg(_FastModel):
     duration: int
-    distance: int | None = Field(default=None)
-    isRealtimeControlled: bool | None = Field(default=None)
+    distance: int | None = None
+    isRealtimeControlled: bool | None = None
     origin: JourneyLegStop
     destination: JourneyLegStop
-    transportation: TripTransportation | None = Field(default=None)
+    transportation: TripTransportation | None = None
     # hints
-    infos: List[JourneyLegStopInfo]
+    infos_raw: List[dict] = Field(alias="infos")
     # pathDescriptions
     # interchange
     # coords
     # properties
 
+    @cached_property
+    def infos(self) -> List[JourneyLegStopInfo]:
+        return [JourneyLegStopInfo.model_validate(info) for info in self.infos_raw]
+
 
-class Journey(BaseModel):
-    rating: int | None
+class Journey(_FastModel):
+    rating: int | None = None
     isAdditional: int
     legs: List[JourneyLeg]
     fare: Fare
 
 
-class TripRequestResponse(BaseModel):
+class TripRequestResponse(_FastModel):
     version: str
     journeys: List[Journey]
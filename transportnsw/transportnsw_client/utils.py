@@ -1,29 +1,54 @@
-from typing import Iterable, Literal
+from typing import Dict, Iterable, Literal, Sequence, Tuple
 
 from google.transit import gtfs_realtime_pb2
 
-from .model import RouteProductClass, JourneyFareTicket, JourneyLeg
+from .model import (
+    WALKING_KLASSES,
+    JourneyFareTicket,
+    JourneyLeg,
+    RouteProductClass,
+)
+
+_GTFS_MODE = {
+    RouteProductClass.BUS: "buses",
+    RouteProductClass.FERRY: "ferries",
+    RouteProductClass.LIGHT_RAIL: "lightrail",
+    RouteProductClass.TRAIN: "sydneytrains",
+}
 
 
 def get_first_nonwalking_leg(legs: Iterable[JourneyLeg]) -> JourneyLeg | None:
     for leg in legs:
-        # Both 99 and 100 indicate walking. = ['99', '100']
-        if leg.transportation.product.klass not in (
-            RouteProductClass.WALKING,
-            RouteProductClass.WALKING_FOOTPATH,
-        ):
+        if leg.transportation.product.klass not in WALKING_KLASSES:
             return leg
 
     return None
 
 
-def count_trip_changes(legs: Iterable[JourneyLeg]) -> int:
+def get_last_nonwalking_leg(legs: Sequence[JourneyLeg]) -> JourneyLeg | None:
+    for i in range(len(legs) - 1, -1, -1):
+        leg = legs[i]
+        if leg.transportation.product.klass not in WALKING_KLASSES:
+            return leg
+
+    return None
+
+
+def summarize_legs(legs: Iterable[JourneyLeg]) -> Tuple[JourneyLeg | None, int]:
+    """Return the first non-walking leg and the number of trip changes."""
+    first = None
     changes = -1
     for leg in legs:
-        if leg.transportation.product.klass not in (99, 100):
+        if leg.transportation.product.klass not in WALKING_KLASSES:
+            if first is None:
+                first = leg
             changes += 1
 
-    return changes
+    return first, changes
+
+
+def count_trip_changes(legs: Iterable[JourneyLeg]) -> int:
+    return summarize_legs(legs)[1]
 
 
 def get_ticket(
@@ -36,22 +61,37 @@ def get_ticket(
     return None
 
 
+def build_realtime_index(
+    feed: gtfs_realtime_pb2.FeedMessage,
+) -> Dict[str, gtfs_realtime_pb2.FeedEntity]:
+    """Index a feed's vehicle entities by realtime trip id."""
+    return {
+        entity.vehicle.trip.trip_id: entity
+        for entity in feed.entity
+        if entity.HasField("vehicle")
+    }
+
+
 def find_realtime_info(feed: gtfs_realtime_pb2.FeedMessage, realtime_trip_id: str):
+    """Find a single trip's entity in a feed.
+
+    Prefer build_realtime_index when looking up more than one trip in the same feed.
+    """
     for entity in feed.entity:
+        if not entity.HasField("vehicle"):
+            continue
         if entity.vehicle.trip.trip_id == realtime_trip_id:
             return entity
 
 
 def get_gtfs_mode(
-    klass: RouteProductClass,
+    klass: int,
 ) -> Literal["buses", "ferries", "lightrail", "sydneytrains"] | None:
-    if klass == RouteProductClass.BUS:
-        return "buses"
-    elif klass == RouteProductClass.FERRY:
-        return "ferries"
-    elif klass == RouteProductClass.LIGHT_RAIL:
-        return "lightrail"
-    elif klass == RouteProductClass.TRAIN:
-        return "sydneytrains"
-    else:
+    return _GTFS_MODE.get(klass)
+
+
+def get_product_class_name(klass: int) -> str | None:
+    try:
+        return RouteProductClass(klass).name
+    except ValueError:
         return None